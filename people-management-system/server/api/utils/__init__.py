@@ -25,7 +25,8 @@ from .security import (
     SecurityError,
     create_security_headers,
     log_security_event,
-    sanitize_person_data
+    sanitize_person_data,
+    sanitize_person_data_batch
 )
 from .cache import (
     InMemoryCache,
@@ -60,6 +61,7 @@ __all__ = [
     "create_security_headers",
     "log_security_event",
     "sanitize_person_data",
+    "sanitize_person_data_batch",
     # Cache utilities
     "InMemoryCache",
     "get_cache",
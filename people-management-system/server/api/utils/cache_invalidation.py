@@ -6,21 +6,58 @@ for selective cache clearing based on tags, dependencies, and data relationships
 """
 
 import logging
+import sys
 import time
-from typing import Dict, List, Set, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Any, Optional, Union
 from threading import Lock
-from dataclasses import dataclass, field
-from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for lookups that miss, so reads never insert
+_EMPTY_SET: frozenset = frozenset()
+
+
+def _as_seq(names: Union[str, Iterable[str]]) -> Iterable[str]:
+    """
+    Normalize a single name or a collection of names to an iterable.
+    
+    A lone string is wrapped in a 1-tuple; lists, tuples, sets and frozensets
+    are returned unchanged so the common single-tag call avoids building a list.
+    """
+    return (names,) if isinstance(names, str) else names
+
+
+@lru_cache(maxsize=16384)
+def _entity_tag(kind: str, entity_id: str) -> str:
+    """
+    Build the interned per-entity tag name (e.g. ``person_<id>``).
+    
+    Hot entities get the same interned string back on every invalidation,
+    so tag dict lookups hit the identity fast path instead of re-hashing a
+    freshly formatted string. The LRU bound caps memory for cold entities.
+    """
+    return sys.intern(f"{kind}_{entity_id}")
+
 
-@dataclass
 class CacheTag:
-    """Represents a cache tag for selective invalidation."""
-    name: str
-    created_at: float = field(default_factory=time.time)
-    keys: Set[str] = field(default_factory=set)
+    """
+    Represents a cache tag for selective invalidation.
+    
+    Uses __slots__ rather than a dataclass since one instance exists per
+    tagged entity and dropping the per-instance __dict__ keeps the tag
+    table compact.
+    """
+    
+    __slots__ = ('name', 'created_at', 'keys')
+    
+    def __init__(self, name: str, created_at: Optional[float] = None, keys: Optional[Set[str]] = None):
+        self.name = name
+        self.created_at = time.time() if created_at is None else created_at
+        self.keys: Set[str] = set() if keys is None else keys
+    
+    def __repr__(self) -> str:
+        return f"CacheTag(name={self.name!r}, created_at={self.created_at!r}, keys={self.keys!r})"
     
     def add_key(self, key: str):
         """Add a cache key to this tag."""
@@ -54,14 +91,16 @@ class SmartCacheInvalidator:
         
         # Tag management
         self._tags: Dict[str, CacheTag] = {}
-        self._key_to_tags: Dict[str, Set[str]] = defaultdict(set)
+        self._empty_tags: Set[str] = set()  # tags with no keys, pending cleanup
+        self._key_to_tags: Dict[str, Set[str]] = {}
         
         # Dependency tracking
-        self._dependencies: Dict[str, Set[str]] = defaultdict(set)  # tag -> dependent tags
-        self._reverse_dependencies: Dict[str, Set[str]] = defaultdict(set)  # tag -> parent tags
+        self._dependencies: Dict[str, Set[str]] = {}  # tag -> dependent tags
+        self._reverse_dependencies: Dict[str, Set[str]] = {}  # tag -> parent tags
+        self._dependency_count = 0  # total edges in _dependencies, kept for get_stats
         
         # Pattern tracking
-        self._patterns: Dict[str, List[str]] = defaultdict(list)  # pattern -> keys
+        self._patterns: Dict[str, List[str]] = {}  # pattern -> keys
         
         # Statistics
         self._invalidation_stats = {
@@ -80,18 +119,16 @@ class SmartCacheInvalidator:
             key: Cache key to tag
             tags: Tag name or list of tag names
         """
-        if isinstance(tags, str):
-            tags = [tags]
-        
         with self._lock:
-            for tag_name in tags:
+            for tag_name in _as_seq(tags):
                 # Create tag if it doesn't exist
                 if tag_name not in self._tags:
                     self._tags[tag_name] = CacheTag(name=tag_name)
                 
                 # Add key to tag
                 self._tags[tag_name].add_key(key)
-                self._key_to_tags[key].add(tag_name)
+                self._empty_tags.discard(tag_name)
+                self._key_to_tags.setdefault(key, set()).add(tag_name)
                 
                 logger.debug(f"Tagged cache key '{key}' with tag '{tag_name}'")
     
@@ -122,8 +159,11 @@ class SmartCacheInvalidator:
             dependent_tag: Dependent tag that gets invalidated with parent
         """
         with self._lock:
-            self._dependencies[parent_tag].add(dependent_tag)
-            self._reverse_dependencies[dependent_tag].add(parent_tag)
+            dependents = self._dependencies.setdefault(parent_tag, set())
+            if dependent_tag not in dependents:
+                dependents.add(dependent_tag)
+                self._dependency_count += 1
+            self._reverse_dependencies.setdefault(dependent_tag, set()).add(parent_tag)
             
             logger.debug(f"Added dependency: {parent_tag} -> {dependent_tag}")
     
@@ -136,7 +176,7 @@ class SmartCacheInvalidator:
             key: Cache key matching this pattern
         """
         with self._lock:
-            self._patterns[pattern].append(key)
+            self._patterns.setdefault(pattern, []).append(key)
             logger.debug(f"Added key '{key}' to pattern '{pattern}'")
     
     def invalidate_by_tag(self, tag_names: Union[str, List[str]], cascade: bool = True) -> Dict[str, Any]:
@@ -150,8 +190,7 @@ class SmartCacheInvalidator:
         Returns:
             Dictionary with invalidation results
         """
-        if isinstance(tag_names, str):
-            tag_names = [tag_names]
+        tag_names = _as_seq(tag_names)
         
         invalidated_keys = set()
         invalidated_tags = set()
@@ -179,12 +218,15 @@ class SmartCacheInvalidator:
                             invalidated_keys.add(key)
                             
                         # Clean up key-to-tag mapping
-                        self._key_to_tags[key].discard(tag_name)
-                        if not self._key_to_tags[key]:
-                            del self._key_to_tags[key]
+                        key_tags = self._key_to_tags.get(key)
+                        if key_tags is not None:
+                            key_tags.discard(tag_name)
+                            if not key_tags:
+                                del self._key_to_tags[key]
                     
                     # Clear the tag
                     tag.keys.clear()
+                    self._empty_tags.add(tag_name)
                     invalidated_tags.add(tag_name)
                     
                     logger.info(f"Invalidated tag '{tag_name}' with {len(keys_to_invalidate)} keys")
@@ -216,8 +258,7 @@ class SmartCacheInvalidator:
         Returns:
             Dictionary with invalidation results
         """
-        if isinstance(patterns, str):
-            patterns = [patterns]
+        patterns = _as_seq(patterns)
         
         invalidated_keys = set()
         
@@ -236,8 +277,11 @@ class SmartCacheInvalidator:
                         # Clean up tag mappings
                         if key in self._key_to_tags:
                             for tag_name in self._key_to_tags[key]:
-                                if tag_name in self._tags:
-                                    self._tags[tag_name].remove_key(key)
+                                tag = self._tags.get(tag_name)
+                                if tag is not None:
+                                    tag.remove_key(key)
+                                    if not tag.keys:
+                                        self._empty_tags.add(tag_name)
                             del self._key_to_tags[key]
                     
                     logger.info(f"Invalidated pattern '{pattern}' with {len(keys_to_invalidate)} keys")
@@ -248,7 +292,7 @@ class SmartCacheInvalidator:
         self._invalidation_stats['keys_invalidated'] += len(invalidated_keys)
         
         result = {
-            'invalidated_patterns': patterns,
+            'invalidated_patterns': list(patterns),
             'invalidated_keys': len(invalidated_keys)
         }
         
@@ -277,7 +321,7 @@ class SmartCacheInvalidator:
             processed.add(current_tag)
             
             # Add direct dependencies
-            direct_deps = self._dependencies.get(current_tag, set())
+            direct_deps = self._dependencies.get(current_tag, _EMPTY_SET)
             dependents.update(direct_deps)
             
             # Add to processing queue for recursive dependencies
@@ -289,27 +333,36 @@ class SmartCacheInvalidator:
         """
         Remove tags that have no associated cache keys.
         
+        Empty tags are tracked incrementally as keys are added and invalidated,
+        so cleanup cost is proportional to the number of empty tags rather
+        than the total number of tags.
+        
         Returns:
             Number of tags removed
         """
+        # Cheap unlocked check so no-op cleanups never contend for the lock
+        if not self._empty_tags:
+            return 0
+        
         with self._lock:
             empty_tags = [
-                tag_name for tag_name, tag in self._tags.items()
-                if not tag.keys
+                tag_name for tag_name in self._empty_tags
+                if tag_name in self._tags and not self._tags[tag_name].keys
             ]
+            self._empty_tags.clear()
             
             for tag_name in empty_tags:
                 del self._tags[tag_name]
                 
                 # Clean up dependencies
                 if tag_name in self._dependencies:
-                    del self._dependencies[tag_name]
+                    self._dependency_count -= len(self._dependencies.pop(tag_name))
                 
-                for parent_tag in self._reverse_dependencies[tag_name]:
-                    self._dependencies[parent_tag].discard(tag_name)
-                
-                if tag_name in self._reverse_dependencies:
-                    del self._reverse_dependencies[tag_name]
+                for parent_tag in self._reverse_dependencies.pop(tag_name, ()):
+                    dependents = self._dependencies.get(parent_tag)
+                    if dependents is not None and tag_name in dependents:
+                        dependents.discard(tag_name)
+                        self._dependency_count -= 1
             
             if empty_tags:
                 logger.info(f"Cleaned up {len(empty_tags)} empty tags")
@@ -336,25 +389,28 @@ class SmartCacheInvalidator:
                 'created_at': tag.created_at,
                 'key_count': len(tag.keys),
                 'keys': list(tag.keys),
-                'dependencies': list(self._dependencies.get(tag_name, set())),
-                'dependent_on': list(self._reverse_dependencies.get(tag_name, set()))
+                'dependencies': list(self._dependencies.get(tag_name, _EMPTY_SET)),
+                'dependent_on': list(self._reverse_dependencies.get(tag_name, _EMPTY_SET))
             }
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache invalidation statistics.
         
+        This does not take the lock: the counters are snapshotted and len()
+        on the tracking dicts is atomic under the GIL, so a stats read never
+        blocks an in-flight invalidation. Values may be momentarily stale.
+        
         Returns:
             Dictionary with invalidation statistics
         """
-        with self._lock:
-            return {
-                **self._invalidation_stats,
-                'total_tags': len(self._tags),
-                'total_patterns': len(self._patterns),
-                'total_dependencies': sum(len(deps) for deps in self._dependencies.values()),
-                'keys_with_tags': len(self._key_to_tags)
-            }
+        return {
+            **self._invalidation_stats,
+            'total_tags': len(self._tags),
+            'total_patterns': len(self._patterns),
+            'total_dependencies': self._dependency_count,
+            'keys_with_tags': len(self._key_to_tags)
+        }
     
     def reset_stats(self):
         """Reset invalidation statistics."""
@@ -413,7 +469,7 @@ class CacheInvalidationStrategies:
         """Invalidate caches when a person is updated."""
         tags_to_invalidate = [
             "people_list",
-            f"person_{person_id}",
+            _entity_tag("person", person_id),
             "search_results"
         ]
         return self.invalidator.invalidate_by_tag(tags_to_invalidate)
@@ -422,7 +478,7 @@ class CacheInvalidationStrategies:
         """Invalidate caches when a person is deleted."""
         tags_to_invalidate = [
             "people_list",
-            f"person_{person_id}",
+            _entity_tag("person", person_id),
             "statistics",
             "search_results",
             "reports"
@@ -433,8 +489,8 @@ class CacheInvalidationStrategies:
         """Invalidate caches when employment is created."""
         tags_to_invalidate = [
             "employment_list",
-            f"person_{person_id}",
-            f"position_{position_id}",
+            _entity_tag("person", person_id),
+            _entity_tag("position", position_id),
             "statistics",
             "reports"
         ]
@@ -444,9 +500,9 @@ class CacheInvalidationStrategies:
         """Invalidate caches when employment is updated."""
         tags_to_invalidate = [
             "employment_list",
-            f"employment_{employment_id}",
-            f"person_{person_id}",
-            f"position_{position_id}",
+            _entity_tag("employment", employment_id),
+            _entity_tag("person", person_id),
+            _entity_tag("position", position_id),
             "statistics"
         ]
         return self.invalidator.invalidate_by_tag(tags_to_invalidate)
@@ -463,7 +519,7 @@ class CacheInvalidationStrategies:
         """Invalidate caches when a department is updated."""
         tags_to_invalidate = [
             "departments_list",
-            f"department_{department_id}",
+            _entity_tag("department", department_id),
             "positions_list",  # Positions display department name
             "employment_list"  # Employment records show department
         ]
@@ -473,7 +529,7 @@ class CacheInvalidationStrategies:
         """Invalidate caches when a position is created."""
         tags_to_invalidate = [
             "positions_list",
-            f"department_{department_id}",
+            _entity_tag("department", department_id),
             "statistics"
         ]
         return self.invalidator.invalidate_by_tag(tags_to_invalidate)
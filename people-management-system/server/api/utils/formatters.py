@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, List
 from datetime import date
 
 from ...database.models import Person, Department, Position, Employment
+from .validators import get_today_iso
 
 
 def format_date_for_api(date_obj: Optional[date]) -> Optional[str]:
@@ -24,7 +25,11 @@ def format_date_for_api(date_obj: Optional[date]) -> Optional[str]:
     """
     if not date_obj:
         return None
-    return date_obj.strftime('%d-%m-%Y')
+    # Direct field formatting avoids strftime's format-string parsing, which
+    # matters since this runs for every date column of every row in list
+    # responses. Unlike strftime('%d-%m-%Y'), the year is always zero-padded
+    # to four digits (0999, not 999), which the DD-MM-YYYY parser requires.
+    return f"{date_obj.day:02d}-{date_obj.month:02d}-{date_obj.year:04d}"
 
 
 def format_person_response(person: Person) -> Dict[str, Any]:
@@ -152,17 +157,23 @@ def format_person_with_employment(person: Person) -> Dict[str, Any]:
     # Get base person data
     person_data = format_person_response(person)
     
-    # Add current employment
-    current_employment = person.current_employment
+    # Partition employments in a single pass: the first active record is the
+    # current employment, inactive records form the history. This avoids a
+    # second walk of the collection via person.current_employment.
+    current_employment = None
+    past_employments = []
+    for emp in person.employments:
+        if not emp.is_active:
+            past_employments.append(emp)
+        elif current_employment is None:
+            current_employment = emp
+    
     current_emp_data = None
     if current_employment:
         current_emp_data = format_employment_summary(current_employment)
     
     # Add employment history (past employments)
-    employment_history = [
-        format_employment_summary(emp)
-        for emp in person.employments if not emp.is_active
-    ]
+    employment_history = [format_employment_summary(emp) for emp in past_employments]
     
     # Add employment data to person data
     person_data.update({
@@ -284,7 +295,7 @@ def format_error_response(error_message: str, error_code: str = None) -> Dict[st
     """
     response = {
         "error": error_message,
-        "timestamp": date.today().isoformat()
+        "timestamp": get_today_iso()
     }
     
     if error_code:
@@ -312,7 +323,7 @@ def format_health_check_response(
     response = {
         "service_name": service_name,
         "status": status,
-        "timestamp": date.today().isoformat()
+        "timestamp": get_today_iso()
     }
     
     if additional_data:
@@ -5,8 +5,10 @@ This module provides the main router for API version 1, including
 version management, route organization, and API metadata.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from functools import lru_cache
 from typing import Dict, Any
+import json
 import time
 
 from ..routes import people, departments, positions, employment, statistics
@@ -16,12 +18,81 @@ from ...core.config import get_settings
 # Create v1 router
 v1_router = APIRouter(prefix="/v1", tags=["v1"])
 
-# Include all v1 routes
-v1_router.include_router(people.router, dependencies=[Depends(get_api_key_optional)])
-v1_router.include_router(departments.router, dependencies=[Depends(get_api_key_optional)])
-v1_router.include_router(positions.router, dependencies=[Depends(get_api_key_optional)])
-v1_router.include_router(employment.router, dependencies=[Depends(get_api_key_optional)])
-v1_router.include_router(statistics.router, dependencies=[Depends(get_api_key_optional)])
+# Include all v1 resource routes with optional API key authentication. The
+# dependency is declared once and shared; it is not set on v1_router itself
+# so the info and health endpoints below stay free of the API key lookup.
+_resource_dependencies = [Depends(get_api_key_optional)]
+
+for _resource in (people, departments, positions, employment, statistics):
+    v1_router.include_router(_resource.router, dependencies=_resource_dependencies)
+
+
+def _json_members(data: Dict[str, Any]) -> str:
+    """
+    Serialize a dict to compact JSON members, without the enclosing braces.
+    
+    Uses the same settings as FastAPI's JSONResponse so spliced payloads
+    match what the framework would have produced.
+    """
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":"))[1:-1]
+
+
+# Static parts of the v1 info and health payloads, serialized once at import.
+# Only the settings-dependent limits and the timestamp are encoded per request.
+_V1_INFO_HEAD = _json_members({
+    "version": "1.0.0",
+    "name": "People Management API v1",
+    "description": "Version 1 of the People Management System API",
+    "status": "stable",
+    "deprecated": False,
+    "sunset_date": None,
+    "capabilities": {
+        "authentication": ["api_key", "optional"],
+        "rate_limiting": True,
+        "pagination": True,
+        "filtering": True,
+        "sorting": True,
+        "bulk_operations": True,
+        "health_checks": True
+    },
+    "endpoints": {
+        "people": "/api/v1/people",
+        "departments": "/api/v1/departments", 
+        "positions": "/api/v1/positions",
+        "employment": "/api/v1/employment",
+        "statistics": "/api/v1/statistics"
+    }
+})
+_V1_INFO_DOCUMENTATION = _json_members({
+    "documentation": {
+        "openapi": "/openapi.json",
+        "swagger_ui": "/docs",
+        "redoc": "/redoc"
+    }
+})
+_V1_HEALTH_HEAD = _json_members({
+    "version": "v1",
+    "status": "healthy"
+})
+_V1_HEALTH_COMPONENTS = _json_members({
+    "components": {
+        "database": "healthy",
+        "authentication": "healthy",
+        "rate_limiting": "healthy"
+    }
+})
+
+
+@lru_cache(maxsize=8)
+def _v1_limits_json(rate_limit_per_minute: int, max_page_size: int, default_page_size: int) -> str:
+    """Serialize the v1 limits member for the given settings values."""
+    return _json_members({
+        "limits": {
+            "rate_limit_per_minute": rate_limit_per_minute,
+            "max_page_size": max_page_size,
+            "default_page_size": default_page_size
+        }
+    })
 
 
 @v1_router.get(
@@ -35,41 +106,18 @@ async def v1_info():
     """Get API v1 information."""
     settings = get_settings()
     
-    return {
-        "version": "1.0.0",
-        "name": "People Management API v1",
-        "description": "Version 1 of the People Management System API",
-        "status": "stable",
-        "deprecated": False,
-        "sunset_date": None,
-        "capabilities": {
-            "authentication": ["api_key", "optional"],
-            "rate_limiting": True,
-            "pagination": True,
-            "filtering": True,
-            "sorting": True,
-            "bulk_operations": True,
-            "health_checks": True
-        },
-        "endpoints": {
-            "people": "/api/v1/people",
-            "departments": "/api/v1/departments", 
-            "positions": "/api/v1/positions",
-            "employment": "/api/v1/employment",
-            "statistics": "/api/v1/statistics"
-        },
-        "limits": {
-            "rate_limit_per_minute": settings.rate_limit_per_minute,
-            "max_page_size": settings.max_page_size,
-            "default_page_size": settings.default_page_size
-        },
-        "documentation": {
-            "openapi": "/openapi.json",
-            "swagger_ui": "/docs",
-            "redoc": "/redoc"
-        },
-        "timestamp": time.time()
-    }
+    # Keyed on the values rather than the settings object, so a reloaded
+    # settings instance with different limits is never served stale data
+    limits = _v1_limits_json(
+        settings.rate_limit_per_minute, settings.max_page_size, settings.default_page_size
+    )
+    
+    # Returned as a ready-made Response so FastAPI skips re-encoding the
+    # static payload; json.dumps renders floats with repr, as below.
+    return Response(
+        content=f'{{{_V1_INFO_HEAD},{limits},{_V1_INFO_DOCUMENTATION},"timestamp":{time.time()!r}}}',
+        media_type="application/json"
+    )
 
 
 @v1_router.get(
@@ -81,16 +129,10 @@ async def v1_info():
 )
 async def v1_health():
     """API v1 specific health check."""
-    return {
-        "version": "v1",
-        "status": "healthy",
-        "timestamp": time.time(),
-        "components": {
-            "database": "healthy",
-            "authentication": "healthy",
-            "rate_limiting": "healthy"
-        }
-    }
+    return Response(
+        content=f'{{{_V1_HEALTH_HEAD},"timestamp":{time.time()!r},{_V1_HEALTH_COMPONENTS}}}',
+        media_type="application/json"
+    )
 
 
 # API Version metadata
@@ -7,7 +7,7 @@ with support for development, staging, and production environments.
 
 from .environments import (
     BaseConfig, DevelopmentConfig, StagingConfig, ProductionConfig,
-    get_config_for_environment, get_current_environment
+    get_config_for_environment, get_current_environment, reload_config
 )
 from .database import DatabaseConfig
 from .security import SecurityConfig
@@ -20,6 +20,7 @@ __all__ = [
     'ProductionConfig',
     'get_config_for_environment',
     'get_current_environment',
+    'reload_config',
     'DatabaseConfig',
     'SecurityConfig',
     'CacheConfig'
@@ -5,7 +5,10 @@ This module provides cache configuration with support for different
 cache backends and cache policies.
 """
 
-from typing import Optional, Dict, Any, List
+import json
+import pickle
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, Callable, Iterable, List, Literal, Tuple
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
@@ -26,6 +29,45 @@ class CacheEvictionPolicy(str, Enum):
     RANDOM = "random"  # Random eviction
 
 
+# (dumps, loads) pair converting cache values to and from bytes
+Serializer = Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 JSON bytes."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_serializer() -> Serializer:
+    """Build the JSON (dumps, loads) pair."""
+    return _json_dumps, json.loads
+
+
+def _pickle_serializer() -> Serializer:
+    """Build the pickle (dumps, loads) pair using the highest protocol."""
+    return partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads
+
+
+def _msgpack_serializer() -> Serializer:
+    """Build the msgpack (dumps, loads) pair."""
+    # Imported on demand: msgpack is only needed when it is configured
+    import msgpack
+    return msgpack.packb, msgpack.unpackb
+
+
+_SERIALIZER_FACTORIES: Dict[str, Callable[[], Serializer]] = {
+    "json": _json_serializer,
+    "pickle": _pickle_serializer,
+    "msgpack": _msgpack_serializer,
+}
+
+
+@lru_cache(maxsize=1024)
+def _build_tag_key(key_prefix: str, tag_separator: str, tag: str) -> str:
+    """Build the cache key under which a tag's members are tracked."""
+    return f"{key_prefix}tag{tag_separator}{tag}"
+
+
 class CacheConfig(BaseModel):
     """
     Cache configuration with support for multiple backends and policies.
@@ -128,7 +170,7 @@ class CacheConfig(BaseModel):
     )
     
     # Serialization Settings
-    serializer: str = Field(
+    serializer: Literal["json", "pickle", "msgpack"] = Field(
         default="json",
         description="Serialization format (json, pickle, msgpack)"
     )
@@ -179,7 +221,8 @@ class CacheConfig(BaseModel):
         description="Separator for cache tag keys"
     )
     
-    # Per-endpoint Cache Settings
+    # Per-endpoint Cache Settings. Built by a literal factory so each instance
+    # owns mutable dicts/lists; this is cheaper than copying a shared constant.
     endpoint_configs: Dict[str, Dict[str, Any]] = Field(
         default_factory=lambda: {
             "people": {
@@ -240,23 +283,6 @@ class CacheConfig(BaseModel):
         description="Health check interval in seconds"
     )
     
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v):
-        """Validate port number."""
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-    
-    @field_validator("serializer")
-    @classmethod
-    def validate_serializer(cls, v):
-        """Validate serializer type."""
-        valid_serializers = ["json", "pickle", "msgpack"]
-        if v not in valid_serializers:
-            raise ValueError(f"Serializer must be one of: {valid_serializers}")
-        return v
-    
     @field_validator("max_ttl")
     @classmethod
     def validate_max_ttl(cls, v, values):
@@ -304,13 +330,18 @@ class CacheConfig(BaseModel):
         Returns:
             Dictionary with endpoint-specific cache configuration
         """
-        default_config = {
+        config = {
             "ttl": self.default_ttl,
             "tags": [endpoint],
             "enabled": self.enabled
         }
         
-        return {**default_config, **self.endpoint_configs.get(endpoint, {})}
+        # Endpoint-specific settings override the defaults in place
+        overrides = self.endpoint_configs.get(endpoint)
+        if overrides:
+            config.update(overrides)
+        
+        return config
     
     def get_cache_key(self, base_key: str, **params) -> str:
         """
@@ -323,17 +354,39 @@ class CacheConfig(BaseModel):
         Returns:
             Formatted cache key
         """
-        key_parts = [self.key_prefix, f"v{self.key_version}", base_key]
+        # Same layout as joining [key_prefix, version, base_key, params] with ":"
+        key = f"{self.key_prefix}:v{self.key_version}:{base_key}"
         
         if params:
-            param_parts = []
-            for k, v in sorted(params.items()):
-                if v is not None:
-                    param_parts.append(f"{k}={v}")
-            if param_parts:
-                key_parts.append("_".join(param_parts))
+            param_suffix = "_".join([f"{k}={v}" for k, v in sorted(params.items()) if v is not None])
+            if param_suffix:
+                key = f"{key}:{param_suffix}"
+        
+        return key
+    
+    def get_cache_key_from_items(self, base_key: str, param_items: Iterable[Tuple[str, Any]]) -> str:
+        """
+        Generate a cache key from parameters that are already in key order.
+        
+        Hot callers with a fixed parameter set can pass a presorted tuple of
+        (name, value) pairs and skip the keyword dict and sort done by
+        get_cache_key. Produces the same key as get_cache_key for the same
+        parameters.
+        
+        Args:
+            base_key: Base cache key
+            param_items: (name, value) pairs sorted by name; None values are skipped
+            
+        Returns:
+            Formatted cache key
+        """
+        key = f"{self.key_prefix}:v{self.key_version}:{base_key}"
+        
+        param_suffix = "_".join([f"{k}={v}" for k, v in param_items if v is not None])
+        if param_suffix:
+            key = f"{key}:{param_suffix}"
         
-        return ":".join(key_parts)
+        return key
     
     def get_tag_key(self, tag: str) -> str:
         """
@@ -345,7 +398,25 @@ class CacheConfig(BaseModel):
         Returns:
             Formatted tag key
         """
-        return f"{self.key_prefix}tag{self.tag_separator}{tag}"
+        # _build_tag_key is memoized on the prefix, separator and tag, so the
+        # key stays correct if the (mutable) configuration is changed
+        return _build_tag_key(self.key_prefix, self.tag_separator, tag)
+    
+    def get_serializer(self) -> Serializer:
+        """
+        Resolve the serialization functions for the configured format.
+        
+        Cache backends should resolve this once (e.g. when they are created)
+        and call the returned functions directly, rather than branching on
+        the serializer setting for every read and write.
+        
+        Returns:
+            Tuple of (dumps, loads) functions converting values to and from bytes
+            
+        Raises:
+            ImportError: If the msgpack serializer is configured but not installed
+        """
+        return _SERIALIZER_FACTORIES[self.serializer]()
     
     def should_compress(self, data_size: int) -> bool:
         """
@@ -5,8 +5,12 @@ This module provides database configuration with support for different
 database backends and connection pool settings.
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Literal, Mapping
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
 
 
@@ -17,6 +21,137 @@ class DatabaseBackend(str, Enum):
     MYSQL = "mysql"
 
 
+# Default SQLite PRAGMA settings; copied into each DatabaseConfig
+_DEFAULT_SQLITE_PRAGMA = MappingProxyType({
+    "journal_mode": "WAL",
+    "cache_size": -2000,  # 2MB cache
+    "foreign_keys": 1,
+    "synchronous": "NORMAL",
+    "temp_store": "memory",
+    "mmap_size": 268435456,  # 256MB
+    "busy_timeout": 5000,  # ms to wait on a locked database
+})
+
+_ISOLATION_LEVEL_CHOICES = (
+    "READ_UNCOMMITTED", "READ_COMMITTED",
+    "REPEATABLE_READ", "SERIALIZABLE"
+)
+_VALID_ISOLATION_LEVELS = frozenset(_ISOLATION_LEVEL_CHOICES)
+_ISOLATION_LEVEL_CHOICES_TEXT = str(list(_ISOLATION_LEVEL_CHOICES))
+
+# Pool sizing defaults for file-backed SQLite, which serialises writers and
+# gains nothing from the larger pool defaults meant for server backends
+_SQLITE_DEFAULT_POOL_SIZE = 5
+_SQLITE_DEFAULT_MAX_OVERFLOW = 10
+
+# URL dialect names recognised for backend auto-detection
+_BACKEND_BY_URL_SCHEME = {
+    "sqlite": DatabaseBackend.SQLITE,
+    "postgresql": DatabaseBackend.POSTGRESQL,
+    "postgres": DatabaseBackend.POSTGRESQL,
+    "mysql": DatabaseBackend.MYSQL,
+    "mariadb": DatabaseBackend.MYSQL,
+}
+
+
+def _is_sqlite_memory_url(url: str) -> bool:
+    """Check whether a SQLite URL points at an in-memory database."""
+    return ":memory:" in url or url.partition("://")[2] in ("", "/")
+
+
+# Keyed on setting values rather than id(config): configs are mutable and
+# ids are reused after garbage collection, so an identity-keyed cache could
+# hand back options for different settings. The URL itself is not part of
+# the key, only flags derived from it, so credentials in it are not kept
+# alive by this process-wide cache
+@lru_cache(maxsize=32)
+def _build_engine_options(backend: DatabaseBackend, sqlite_memory: bool, uses_asyncpg: bool,
+                          echo: bool, echo_pool: bool,
+                          pool_size: int, max_overflow: int, pool_timeout: int,
+                          pool_recycle: int, isolation_level: Optional[str],
+                          query_cache_size: int, prepared_statement_cache_size: int,
+                          postgresql_sslmode: str, postgresql_schema: Optional[str],
+                          mysql_charset: str, mysql_sql_mode: str) -> Mapping[str, Any]:
+    """Build the read-only SQLAlchemy engine options for a database configuration."""
+    options = {
+        "echo": echo,
+        "echo_pool": echo_pool,
+        "query_cache_size": query_cache_size,
+    }
+    
+    if sqlite_memory:
+        # An in-memory database lives and dies with its connection, so share
+        # a single one; StaticPool takes no sizing options
+        options["poolclass"] = StaticPool
+    else:
+        options.update({
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+        })
+    
+    # Add isolation level if specified
+    if isolation_level:
+        options["isolation_level"] = isolation_level
+    
+    # Backend-specific options
+    if backend == DatabaseBackend.SQLITE:
+        # PRAGMAs are not connect() arguments; they are issued per connection
+        # by DatabaseConfig.apply_sqlite_pragmas
+        options["connect_args"] = MappingProxyType({"check_same_thread": False})
+    elif backend == DatabaseBackend.POSTGRESQL:
+        connect_args = {}
+        if postgresql_sslmode:
+            connect_args["sslmode"] = postgresql_sslmode
+        if postgresql_schema:
+            connect_args["options"] = f"-csearch_path={postgresql_schema}"
+        if uses_asyncpg:
+            connect_args["prepared_statement_cache_size"] = prepared_statement_cache_size
+        if connect_args:
+            options["connect_args"] = MappingProxyType(connect_args)
+    elif backend == DatabaseBackend.MYSQL:
+        options["connect_args"] = MappingProxyType({
+            "charset": mysql_charset,
+            "sql_mode": mysql_sql_mode,
+        })
+    
+    return MappingProxyType(options)
+
+
+@lru_cache(maxsize=32)
+def _build_backup_settings(enabled: bool, interval_hours: int,
+                           retention_days: int) -> Mapping[str, Any]:
+    """Build the read-only backup settings view."""
+    return MappingProxyType({
+        "enabled": enabled,
+        "interval_hours": interval_hours,
+        "retention_days": retention_days,
+    })
+
+
+@lru_cache(maxsize=32)
+def _build_query_cache_settings(enabled: bool, maxsize: int, ttl: int,
+                                backend: str) -> Mapping[str, Any]:
+    """Build the read-only query result cache settings view."""
+    return MappingProxyType({
+        "enabled": enabled,
+        "maxsize": maxsize,
+        "ttl": ttl,
+        "backend": backend,
+    })
+
+
+@lru_cache(maxsize=32)
+def _build_monitoring_settings(slow_query_threshold: float,
+                               log_slow_queries: bool) -> Mapping[str, Any]:
+    """Build the read-only monitoring settings view."""
+    return MappingProxyType({
+        "slow_query_threshold": slow_query_threshold,
+        "log_slow_queries": log_slow_queries,
+    })
+
+
 class DatabaseConfig(BaseModel):
     """
     Database configuration with support for multiple backends.
@@ -37,16 +172,16 @@ class DatabaseConfig(BaseModel):
     
     # Connection pool settings
     pool_size: int = Field(
-        default=5,
+        default=10,
         ge=1,
         le=50,
-        description="Size of the connection pool"
+        description="Size of the connection pool (SQLite defaults to 5)"
     )
     max_overflow: int = Field(
-        default=10,
+        default=20,
         ge=0,
         le=100,
-        description="Number of connections that can overflow the pool"
+        description="Number of connections that can overflow the pool (SQLite defaults to 10)"
     )
     pool_timeout: int = Field(
         default=30,
@@ -81,18 +216,32 @@ class DatabaseConfig(BaseModel):
         description="Transaction isolation level"
     )
     
+    # Statement caching
+    query_cache_size: int = Field(
+        default=1200,
+        ge=0,
+        description="Size of SQLAlchemy's compiled SQL cache (0 disables it)"
+    )
+    prepared_statement_cache_size: int = Field(
+        default=500,
+        ge=0,
+        description="Per-connection prepared statement cache size (asyncpg driver only)"
+    )
+    
     # SQLite-specific settings
     sqlite_pragma: Dict[str, Any] = Field(
-        default_factory=lambda: {
-            "journal_mode": "WAL",
-            "cache_size": -2000,  # 2MB cache
-            "foreign_keys": 1,
-            "synchronous": "NORMAL",
-            "temp_store": "memory",
-            "mmap_size": 268435456,  # 256MB
-        },
+        default_factory=lambda: dict(_DEFAULT_SQLITE_PRAGMA),
         description="SQLite PRAGMA settings"
     )
+    optimize_on_close: bool = Field(
+        default=True,
+        description="Run PRAGMA optimize when a SQLite connection is closed"
+    )
+    analysis_limit: int = Field(
+        default=400,
+        ge=0,
+        description="SQLite analysis_limit used by PRAGMA optimize on close"
+    )
     
     # PostgreSQL-specific settings
     postgresql_schema: Optional[str] = Field(
@@ -126,6 +275,27 @@ class DatabaseConfig(BaseModel):
         description="Automatically run migrations on startup"
     )
     
+    # Query result cache settings
+    query_result_cache_enabled: bool = Field(
+        default=True,
+        description="Cache results of repeated read queries"
+    )
+    query_result_cache_maxsize: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of cached query results"
+    )
+    query_result_cache_ttl: int = Field(
+        default=60,
+        ge=1,
+        le=86400,
+        description="Query result cache TTL in seconds"
+    )
+    query_result_cache_backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Where cached query results are stored"
+    )
+    
     # Backup and maintenance settings
     backup_enabled: bool = Field(
         default=True,
@@ -156,101 +326,145 @@ class DatabaseConfig(BaseModel):
         description="Log queries slower than threshold"
     )
     
-    @field_validator("backend", mode="before")
-    @classmethod
-    def detect_backend_from_url(cls, v, values):
+    @model_validator(mode="after")
+    def detect_backend_from_url(self) -> "DatabaseConfig":
         """Auto-detect database backend from URL if not specified."""
-        if isinstance(values, dict) and "url" in values:
-            url = values["url"]
-            if url.startswith("sqlite"):
-                return DatabaseBackend.SQLITE
-            elif url.startswith("postgresql"):
-                return DatabaseBackend.POSTGRESQL
-            elif url.startswith("mysql"):
-                return DatabaseBackend.MYSQL
-        return v
+        # Runs after field validation so the URL is available; an explicitly
+        # given backend is left alone
+        if "backend" not in self.model_fields_set:
+            # Dialect of "dialect+driver://...", e.g. "postgresql+psycopg2"
+            scheme = self.url.partition(":")[0].partition("+")[0].lower()
+            # Bypass BaseModel.__setattr__ so a detected backend is not
+            # reported in model_fields_set as if the caller had set it
+            object.__setattr__(
+                self, "backend", _BACKEND_BY_URL_SCHEME.get(scheme, self.backend)
+            )
+        return self
+    
+    @model_validator(mode="after")
+    def apply_sqlite_pool_defaults(self) -> "DatabaseConfig":
+        """Use the smaller SQLite pool defaults unless sizes were given."""
+        # Stored on the fields so model_dump() reports the sizes the engine
+        # uses; like the detected backend, they are not marked as set
+        if self.backend == DatabaseBackend.SQLITE:
+            fields_set = self.model_fields_set
+            if "pool_size" not in fields_set:
+                object.__setattr__(self, "pool_size", _SQLITE_DEFAULT_POOL_SIZE)
+            if "max_overflow" not in fields_set:
+                object.__setattr__(self, "max_overflow", _SQLITE_DEFAULT_MAX_OVERFLOW)
+        return self
     
     @field_validator("isolation_level")
     @classmethod
     def validate_isolation_level(cls, v):
         """Validate transaction isolation level."""
         if v is not None:
-            valid_levels = [
-                "READ_UNCOMMITTED", "READ_COMMITTED", 
-                "REPEATABLE_READ", "SERIALIZABLE"
-            ]
-            if v.upper() not in valid_levels:
-                raise ValueError(f"Isolation level must be one of: {valid_levels}")
-            return v.upper()
+            level = v.upper()
+            if level not in _VALID_ISOLATION_LEVELS:
+                raise ValueError(f"Isolation level must be one of: {_ISOLATION_LEVEL_CHOICES_TEXT}")
+            return level
         return v
     
-    def get_engine_options(self) -> Dict[str, Any]:
+    def get_engine_options(self) -> Mapping[str, Any]:
         """
         Get SQLAlchemy engine options for this configuration.
         
+        The options are memoized on the settings they are built from, so the
+        returned mapping is shared and read-only; it can be passed straight to
+        ``create_engine(url, **options)``.
+        
         Returns:
-            Dictionary of engine options
+            Read-only mapping of engine options
         """
-        options = {
-            "echo": self.echo,
-            "echo_pool": self.echo_pool,
-            "pool_size": self.pool_size,
-            "max_overflow": self.max_overflow,
-            "pool_timeout": self.pool_timeout,
-            "pool_recycle": self.pool_recycle,
-        }
+        url = self.url
+        return _build_engine_options(
+            self.backend,
+            self.backend == DatabaseBackend.SQLITE and _is_sqlite_memory_url(url),
+            "+asyncpg" in url.partition(":")[0],
+            self.echo, self.echo_pool,
+            self.pool_size, self.max_overflow, self.pool_timeout, self.pool_recycle,
+            self.isolation_level, self.query_cache_size, self.prepared_statement_cache_size,
+            self.postgresql_sslmode, self.postgresql_schema,
+            self.mysql_charset, self.mysql_sql_mode,
+        )
+    
+    def apply_sqlite_pragmas(self, dbapi_connection, connection_record) -> None:
+        """
+        Apply the configured SQLite PRAGMA settings to a new connection.
         
-        # Add isolation level if specified
-        if self.isolation_level:
-            options["isolation_level"] = self.isolation_level
+        Intended as a SQLAlchemy ``connect`` event listener.
         
-        # Backend-specific options
-        if self.backend == DatabaseBackend.SQLITE:
-            options.update({
-                "connect_args": {
-                    "check_same_thread": False,
-                    **{f"PRAGMA {key} = {value}": None for key, value in self.sqlite_pragma.items()}
-                }
-            })
-        elif self.backend == DatabaseBackend.POSTGRESQL:
-            connect_args = {}
-            if self.postgresql_sslmode:
-                connect_args["sslmode"] = self.postgresql_sslmode
-            if self.postgresql_schema:
-                connect_args["options"] = f"-csearch_path={self.postgresql_schema}"
-            if connect_args:
-                options["connect_args"] = connect_args
-        elif self.backend == DatabaseBackend.MYSQL:
-            options.update({
-                "connect_args": {
-                    "charset": self.mysql_charset,
-                    "sql_mode": self.mysql_sql_mode,
-                }
-            })
+        Args:
+            dbapi_connection: Raw DB-API connection
+            connection_record: Pool connection record (unused)
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for key, value in self.sqlite_pragma.items():
+                cursor.execute(f"PRAGMA {key}={value}")
+        finally:
+            cursor.close()
+    
+    def optimize_sqlite_connection(self, dbapi_connection, connection_record) -> None:
+        """
+        Refresh SQLite query planner statistics before a connection is closed.
         
-        return options
+        Intended as a SQLAlchemy ``close`` event listener; ``analysis_limit``
+        bounds the work PRAGMA optimize does instead of a full ANALYZE.
+        
+        Args:
+            dbapi_connection: Raw DB-API connection
+            connection_record: Pool connection record (unused)
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA analysis_limit={self.analysis_limit}")
+            cursor.execute("PRAGMA optimize")
+        finally:
+            cursor.close()
     
-    def get_backup_settings(self) -> Dict[str, Any]:
+    def register_engine_events(self, engine) -> None:
+        """
+        Register the backend-specific connection listeners on an engine.
+        
+        Args:
+            engine: SQLAlchemy engine created from this configuration
+        """
+        if self.backend == DatabaseBackend.SQLITE:
+            event.listen(engine, "connect", self.apply_sqlite_pragmas)
+            if self.optimize_on_close:
+                event.listen(engine, "close", self.optimize_sqlite_connection)
+    
+    def get_backup_settings(self) -> Mapping[str, Any]:
         """
         Get backup configuration settings.
         
         Returns:
-            Dictionary of backup settings
+            Read-only mapping of backup settings
+        """
+        return _build_backup_settings(
+            self.backup_enabled, self.backup_interval_hours, self.backup_retention_days
+        )
+    
+    def get_query_cache_settings(self) -> Mapping[str, Any]:
+        """
+        Get query result cache settings.
+        
+        Results are keyed on the rendered SQL and its bound parameters.
+        
+        Returns:
+            Read-only mapping of query result cache settings
         """
-        return {
-            "enabled": self.backup_enabled,
-            "interval_hours": self.backup_interval_hours,
-            "retention_days": self.backup_retention_days,
-        }
+        return _build_query_cache_settings(
+            self.query_result_cache_enabled, self.query_result_cache_maxsize,
+            self.query_result_cache_ttl, self.query_result_cache_backend
+        )
     
-    def get_monitoring_settings(self) -> Dict[str, Any]:
+    def get_monitoring_settings(self) -> Mapping[str, Any]:
         """
         Get monitoring configuration settings.
         
         Returns:
-            Dictionary of monitoring settings
+            Read-only mapping of monitoring settings
         """
-        return {
-            "slow_query_threshold": self.slow_query_threshold,
-            "log_slow_queries": self.log_slow_queries,
-        }
\ No newline at end of file
+        return _build_monitoring_settings(self.slow_query_threshold, self.log_slow_queries)
@@ -5,8 +5,11 @@ This module provides different configuration classes for different environments
 (development, staging, production) with appropriate defaults and validation.
 """
 
+import json
 import os
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
@@ -20,6 +23,47 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
+# Default values shared by the configuration classes; the field factories
+# copy them so each instance gets its own mutable value
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+)
+_DEFAULT_ALLOWED_FILE_TYPES = (
+    "image/jpeg", "image/png", "image/gif",
+    "application/pdf", "text/csv",
+)
+_DEFAULT_FEATURES = MappingProxyType({
+    "bulk_operations": True,
+    "advanced_search": True,
+    "file_uploads": True,
+    "audit_logging": True,
+    "real_time_notifications": False,
+})
+_ALL_FEATURES_ENABLED = MappingProxyType(dict.fromkeys(_DEFAULT_FEATURES, True))
+
+
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVEL_CHOICES)
+_LOG_LEVEL_CHOICES_TEXT = str(list(_LOG_LEVEL_CHOICES))
+
+# Placeholder secret keys shipped as defaults, rejected in production
+_INSECURE_SECRET_KEYS = frozenset({
+    "your-secret-key-change-in-production",
+    "dev-secret-key-not-for-production",
+})
+
+# Values read as "on" in the key=value feature flag format
+_TRUTHY_FEATURE_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into its non-empty, stripped items."""
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
 class BaseConfig(BaseSettings):
     """
     Base configuration with common settings for all environments.
@@ -81,12 +125,7 @@ class BaseConfig(BaseSettings):
     
     # CORS settings
     cors_origins: List[str] = Field(
-        default_factory=lambda: [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3000",
-            "http://127.0.0.1:3001"
-        ],
+        default_factory=lambda: list(_DEFAULT_CORS_ORIGINS),
         description="Allowed CORS origins"
     )
     cors_credentials: bool = Field(default=True, description="Allow credentials in CORS")
@@ -120,10 +159,7 @@ class BaseConfig(BaseSettings):
         description="Maximum file size in bytes (10MB)"
     )
     allowed_file_types: List[str] = Field(
-        default_factory=lambda: [
-            "image/jpeg", "image/png", "image/gif", 
-            "application/pdf", "text/csv"
-        ],
+        default_factory=lambda: list(_DEFAULT_ALLOWED_FILE_TYPES),
         description="Allowed file MIME types"
     )
     
@@ -134,63 +170,40 @@ class BaseConfig(BaseSettings):
     
     # Feature flags
     features: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "bulk_operations": True,
-            "advanced_search": True,
-            "file_uploads": True,
-            "audit_logging": True,
-            "real_time_notifications": False
-        },
+        default_factory=lambda: dict(_DEFAULT_FEATURES),
         description="Feature flags"
     )
     
-    @field_validator("cors_origins", mode="before")
+    @field_validator("cors_origins", "allowed_file_types", mode="before")
     @classmethod
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from environment variable."""
+    def parse_csv_list(cls, v):
+        """Parse a comma-separated list (CORS origins, file types) from environment variable."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
+            return _split_csv(v)
         return v or []
     
-    @field_validator("cors_methods", mode="before")
+    @field_validator("cors_methods", "cors_headers", mode="before")
     @classmethod
-    def parse_cors_methods(cls, v):
-        """Parse CORS methods from environment variable."""
+    def parse_csv_list_or_wildcard(cls, v):
+        """Parse CORS methods or headers from environment variable, defaulting to a wildcard."""
         if isinstance(v, str):
-            return [method.strip() for method in v.split(",") if method.strip()]
+            return _split_csv(v)
         return v or ["*"]
     
-    @field_validator("cors_headers", mode="before")
-    @classmethod
-    def parse_cors_headers(cls, v):
-        """Parse CORS headers from environment variable."""
-        if isinstance(v, str):
-            return [header.strip() for header in v.split(",") if header.strip()]
-        return v or ["*"]
-    
-    @field_validator("allowed_file_types", mode="before")
-    @classmethod
-    def parse_allowed_file_types(cls, v):
-        """Parse allowed file types from environment variable."""
-        if isinstance(v, str):
-            return [file_type.strip() for file_type in v.split(",") if file_type.strip()]
-        return v or []
-    
     @field_validator("features", mode="before")
     @classmethod
     def parse_features(cls, v):
         """Parse feature flags from environment variable."""
         if isinstance(v, str):
             try:
-                import json
                 return json.loads(v)
             except json.JSONDecodeError:
                 # Fallback to simple key=value format
                 features = {}
                 for feature in v.split(","):
-                    if "=" in feature:
-                        key, value = feature.split("=", 1)
-                        features[key.strip()] = value.strip().lower() in ("true", "1", "yes")
+                    key, sep, value = feature.partition("=")
+                    if sep:
+                        features[key.strip()] = value.strip().lower() in _TRUTHY_FEATURE_VALUES
                 return features
         return v or {}
     
@@ -198,10 +211,10 @@ class BaseConfig(BaseSettings):
     @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {_LOG_LEVEL_CHOICES_TEXT}")
+        return level
     
     @field_validator("port")
     @classmethod
@@ -222,8 +235,16 @@ class BaseConfig(BaseSettings):
     model_config = ConfigDict(
         env_file=".env",
         env_prefix="APP_",
+        # Must stay case-insensitive: a case-sensitive source looks up
+        # APP_<field name> verbatim (APP_log_level), so the conventional
+        # upper-case variables would be ignored; measured no faster either
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        # Instances are cached and shared by get_config_for_environment
+        frozen=True,
+        # Build each environment class's schema on first use; a process
+        # normally instantiates only one of them
+        defer_build=True
     )
 
 
@@ -259,13 +280,7 @@ class DevelopmentConfig(BaseConfig):
     
     # Enable all features in development
     features: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "bulk_operations": True,
-            "advanced_search": True,
-            "file_uploads": True,
-            "audit_logging": True,
-            "real_time_notifications": True
-        }
+        default_factory=lambda: dict(_ALL_FEATURES_ENABLED)
     )
 
 
@@ -301,13 +316,7 @@ class StagingConfig(BaseConfig):
     
     # Enable most features in staging
     features: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "bulk_operations": True,
-            "advanced_search": True,
-            "file_uploads": True,
-            "audit_logging": True,
-            "real_time_notifications": True
-        }
+        default_factory=lambda: dict(_ALL_FEATURES_ENABLED)
     )
 
 
@@ -346,26 +355,20 @@ class ProductionConfig(BaseConfig):
     
     # Production CORS should be more restrictive
     cors_origins: List[str] = Field(
-        default_factory=lambda: [],  # Must be set explicitly in production
+        default_factory=list,  # Must be set explicitly in production
         description="Allowed CORS origins (must be configured for production)"
     )
     
     # Conservative feature flags for production
     features: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "bulk_operations": True,
-            "advanced_search": True,
-            "file_uploads": True,
-            "audit_logging": True,
-            "real_time_notifications": False  # Disable until proven stable
-        }
+        default_factory=lambda: dict(_DEFAULT_FEATURES)  # Real-time notifications off until proven stable
     )
     
     @field_validator("secret_key")
     @classmethod
     def validate_production_secret_key(cls, v):
         """Ensure secret key is changed in production."""
-        if v == "your-secret-key-change-in-production" or v == "dev-secret-key-not-for-production":
+        if v in _INSECURE_SECRET_KEYS:
             raise ValueError(
                 "Secret key must be changed in production. "
                 "Set APP_SECRET_KEY environment variable to a secure random value."
@@ -394,6 +397,9 @@ class TestingConfig(BaseConfig):
     
     environment: Environment = Environment.TESTING
     
+    # Tests are configured explicitly; skip reading the .env file
+    model_config = ConfigDict(env_file=None)
+    
     # Testing-specific overrides
     debug: bool = True
     reload: bool = False
@@ -419,20 +425,34 @@ class TestingConfig(BaseConfig):
     
     # Enable all features for comprehensive testing
     features: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "bulk_operations": True,
-            "advanced_search": True,
-            "file_uploads": True,
-            "audit_logging": True,
-            "real_time_notifications": True
-        }
+        default_factory=lambda: dict(_ALL_FEATURES_ENABLED)
     )
 
 
+# Variables naming the environment, in order of precedence
+_ENVIRONMENT_VARIABLES = ("APP_ENVIRONMENT", "ENVIRONMENT", "ENV")
+
+# Map common environment names
+_ENVIRONMENT_ALIASES = {
+    "dev": Environment.DEVELOPMENT,
+    "development": Environment.DEVELOPMENT,
+    "stage": Environment.STAGING,
+    "staging": Environment.STAGING,
+    "prod": Environment.PRODUCTION,
+    "production": Environment.PRODUCTION,
+    "test": Environment.TESTING,
+    "testing": Environment.TESTING
+}
+
+
+@lru_cache()
 def get_current_environment() -> Environment:
     """
     Determine the current environment from environment variables.
     
+    The result is cached for the life of the process; call reload_config()
+    after changing the environment variables.
+    
     Checks the following environment variables in order:
     1. APP_ENVIRONMENT
     2. ENVIRONMENT
@@ -442,36 +462,43 @@ def get_current_environment() -> Environment:
     Returns:
         Current environment enum value
     """
-    env_value = (
-        os.getenv("APP_ENVIRONMENT") or 
-        os.getenv("ENVIRONMENT") or 
-        os.getenv("ENV") or 
-        "development"
-    ).lower()
+    environ = os.environ
     
     # Special case for testing
-    if os.getenv("TESTING") or os.getenv("APP_TESTING") or env_value in ("test", "testing"):
+    if environ.get("TESTING") or environ.get("APP_TESTING"):
         return Environment.TESTING
     
-    # Map common environment names
-    env_mapping = {
-        "dev": Environment.DEVELOPMENT,
-        "development": Environment.DEVELOPMENT,
-        "stage": Environment.STAGING,
-        "staging": Environment.STAGING,
-        "prod": Environment.PRODUCTION,
-        "production": Environment.PRODUCTION,
-        "test": Environment.TESTING,
-        "testing": Environment.TESTING
-    }
-    
-    return env_mapping.get(env_value, Environment.DEVELOPMENT)
+    env_value = next(filter(None, map(environ.get, _ENVIRONMENT_VARIABLES)), "development")
+    return _ENVIRONMENT_ALIASES.get(env_value.lower(), Environment.DEVELOPMENT)
+
+
+_CONFIG_CLASS_BY_ENVIRONMENT = {
+    Environment.DEVELOPMENT: DevelopmentConfig,
+    Environment.STAGING: StagingConfig,
+    Environment.PRODUCTION: ProductionConfig,
+    Environment.TESTING: TestingConfig
+}
+
+
+# Keyed on the config class rather than the environment argument: the
+# implicit, enum and plain-string forms of a call then share one instance
+# (lru_cache uses an exact str argument as its own key but wraps an enum
+# member, so the two never match). The config classes are frozen, as the
+# instance is shared by every caller
+@lru_cache()
+def _config_instance(config_class: type) -> BaseConfig:
+    """Create the shared configuration instance for a config class."""
+    return config_class()
 
 
 def get_config_for_environment(environment: Optional[Environment] = None) -> BaseConfig:
     """
     Get configuration for the specified or current environment.
     
+    One read-only configuration instance is created and cached per
+    environment; call reload_config() to pick up changed environment
+    variables.
+    
     Args:
         environment: Target environment, defaults to current environment
         
@@ -481,15 +508,14 @@ def get_config_for_environment(environment: Optional[Environment] = None) -> Bas
     if environment is None:
         environment = get_current_environment()
     
-    config_map = {
-        Environment.DEVELOPMENT: DevelopmentConfig,
-        Environment.STAGING: StagingConfig,
-        Environment.PRODUCTION: ProductionConfig,
-        Environment.TESTING: TestingConfig
-    }
-    
-    config_class = config_map.get(environment, DevelopmentConfig)
-    return config_class()
+    config_class = _CONFIG_CLASS_BY_ENVIRONMENT.get(environment, DevelopmentConfig)
+    return _config_instance(config_class)
+
+
+def reload_config() -> None:
+    """Clear the cached environment and configurations so they are re-read."""
+    get_current_environment.cache_clear()
+    _config_instance.cache_clear()
 
 
 # Environment detection helpers
@@ -5,23 +5,110 @@ This module provides security configuration including authentication,
 authorization, encryption, and security policies.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Literal, Mapping, Tuple
+from pydantic import Field, field_validator
+from pydantic.dataclasses import dataclass
 from datetime import timedelta
 import secrets
+import string
 
 
-class SecurityConfig(BaseModel):
+# Character classes checked by the password policy
+_PASSWORD_SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_PASSWORD_SPECIAL_CHAR_SET = frozenset(_PASSWORD_SPECIAL_CHARS)
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+_ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+
+_JWT_ALGORITHM_CHOICES = ("HS256", "HS384", "HS512", "RS256", "RS384", "RS512")
+_ALLOWED_JWT_ALGORITHMS = frozenset(_JWT_ALGORITHM_CHOICES)
+_JWT_ALGORITHM_CHOICES_TEXT = str(list(_JWT_ALGORITHM_CHOICES))
+
+# Default HTTP security headers; copied into each SecurityConfig
+_DEFAULT_SECURITY_HEADERS = MappingProxyType({
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=(), payment=()"
+})
+
+# Default or well-known secret keys rejected by validate_secret_key
+_WEAK_SECRET_KEYS = frozenset({
+    "your-secret-key-change-in-production",
+    "dev-secret-key-not-for-production",
+    "secret",
+    "password",
+    "123456789012345678901234567890123456",
+})
+
+
+@lru_cache(maxsize=1)
+def _default_secret_key() -> str:
+    """Generate the process-wide random secret key used when none is configured."""
+    return secrets.token_urlsafe(32)
+
+
+@lru_cache(maxsize=32)
+def _build_password_policy(min_length: int, require_uppercase: bool, require_lowercase: bool,
+                           require_digits: bool, require_special: bool, hash_rounds: int,
+                           token_hash_rounds: int, hash_algorithm: str, hash_worker_processes: int,
+                           history_limit: int) -> Mapping[str, Any]:
+    """Build the read-only password policy view."""
+    return MappingProxyType({
+        "min_length": min_length,
+        "require_uppercase": require_uppercase,
+        "require_lowercase": require_lowercase,
+        "require_digits": require_digits,
+        "require_special": require_special,
+        "hash_rounds": hash_rounds,
+        "token_hash_rounds": token_hash_rounds,
+        "hash_algorithm": hash_algorithm,
+        "hash_worker_processes": hash_worker_processes,
+        "history_limit": history_limit,
+    })
+
+
+@lru_cache(maxsize=32)
+def _build_rate_limit_config(per_minute: int, burst: int, login_per_minute: int,
+                             api_key_multiplier: float) -> Mapping[str, Any]:
+    """Build the read-only rate limiting view."""
+    return MappingProxyType({
+        "per_minute": per_minute,
+        "burst": burst,
+        "login_per_minute": login_per_minute,
+        "api_key_multiplier": api_key_multiplier,
+    })
+
+
+# Only the expiry timedeltas are cached; the secret key stays out of this
+# process-wide cache so rotated or test secrets are not kept alive
+@lru_cache(maxsize=32)
+def _jwt_token_lifetimes(access_token_expire_minutes: int,
+                         refresh_token_expire_days: int) -> Tuple[timedelta, timedelta]:
+    """Build the access and refresh token lifetimes once per setting."""
+    return (
+        timedelta(minutes=access_token_expire_minutes),
+        timedelta(days=refresh_token_expire_days),
+    )
+
+
+@dataclass(frozen=True)
+class SecurityConfig:
     """
     Security configuration for authentication, encryption, and policies.
     
     Provides comprehensive security settings including JWT configuration,
-    password policies, rate limiting, and security headers.
+    password policies, rate limiting, and security headers. Instances are
+    validated on construction and read-only afterwards.
     """
     
     # JWT Configuration
     secret_key: str = Field(
-        default_factory=lambda: secrets.token_urlsafe(32),
+        default_factory=_default_secret_key,
         min_length=32,
         description="Secret key for JWT signing and encryption"
     )
@@ -71,6 +158,22 @@ class SecurityConfig(BaseModel):
         le=20,
         description="Number of bcrypt hash rounds"
     )
+    token_hash_rounds: int = Field(
+        default=6,
+        ge=4,
+        le=10,
+        description="Bcrypt rounds for high-entropy session/refresh tokens"
+    )
+    password_hash_algorithm: Literal["bcrypt", "argon2id"] = Field(
+        default="bcrypt",
+        description="Password hashing scheme (argon2id requires argon2-cffi)"
+    )
+    password_hash_worker_processes: int = Field(
+        default=2,
+        ge=0,
+        le=16,
+        description="Worker processes for password hashing (0 hashes inline)"
+    )
     password_history_limit: int = Field(
         default=5,
         ge=0,
@@ -172,14 +275,7 @@ class SecurityConfig(BaseModel):
     
     # Security Headers
     security_headers: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'",
-            "Permissions-Policy": "camera=(), microphone=(), geolocation=(), payment=()"
-        },
+        default_factory=lambda: dict(_DEFAULT_SECURITY_HEADERS),
         description="HTTP security headers"
     )
     
@@ -245,13 +341,31 @@ class SecurityConfig(BaseModel):
         description="Email address for security alerts"
     )
     
+    def __post_init__(self):
+        """Snapshot the response headers; the config is read-only once built."""
+        headers = dict(self.security_headers)
+        
+        # Add HSTS header if HTTPS is forced
+        if self.force_https:
+            hsts_value = f"max-age={self.hsts_max_age}"
+            if self.hsts_include_subdomains:
+                hsts_value += "; includeSubDomains"
+            headers["Strict-Transport-Security"] = hsts_value
+        
+        object.__setattr__(self, "_security_headers_view", MappingProxyType(headers))
+        
+        # Pre-encoded for ASGI, which wants lower-cased latin-1 name/value bytes
+        object.__setattr__(self, "_security_headers_wire", tuple(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ))
+    
     @field_validator("algorithm")
     @classmethod
     def validate_jwt_algorithm(cls, v):
         """Validate JWT algorithm."""
-        allowed_algorithms = ["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
-        if v not in allowed_algorithms:
-            raise ValueError(f"JWT algorithm must be one of: {allowed_algorithms}")
+        if v not in _ALLOWED_JWT_ALGORITHMS:
+            raise ValueError(f"JWT algorithm must be one of: {_JWT_ALGORITHM_CHOICES_TEXT}")
         return v
     
     @field_validator("secret_key")
@@ -262,80 +376,88 @@ class SecurityConfig(BaseModel):
             raise ValueError("Secret key must be at least 32 characters long")
         
         # Check for common weak keys
-        weak_keys = [
-            "your-secret-key-change-in-production",
-            "dev-secret-key-not-for-production",
-            "secret",
-            "password",
-            "123456789012345678901234567890123456"
-        ]
-        if v in weak_keys:
+        if v in _WEAK_SECRET_KEYS:
             raise ValueError("Secret key appears to be a default or weak value")
         
         return v
     
-    def get_password_policy(self) -> Dict[str, Any]:
+    def get_password_policy(self) -> Mapping[str, Any]:
         """
         Get password policy configuration.
         
         Returns:
-            Dictionary with password policy settings
+            Read-only mapping with password policy settings
         """
-        return {
-            "min_length": self.password_min_length,
-            "require_uppercase": self.password_require_uppercase,
-            "require_lowercase": self.password_require_lowercase,
-            "require_digits": self.password_require_digits,
-            "require_special": self.password_require_special,
-            "hash_rounds": self.password_hash_rounds,
-            "history_limit": self.password_history_limit,
-        }
+        return _build_password_policy(
+            self.password_min_length,
+            self.password_require_uppercase,
+            self.password_require_lowercase,
+            self.password_require_digits,
+            self.password_require_special,
+            self.password_hash_rounds,
+            self.token_hash_rounds,
+            self.password_hash_algorithm,
+            self.password_hash_worker_processes,
+            self.password_history_limit,
+        )
     
-    def get_rate_limit_config(self) -> Dict[str, Any]:
+    def get_rate_limit_config(self) -> Mapping[str, Any]:
         """
         Get rate limiting configuration.
         
         Returns:
-            Dictionary with rate limiting settings
+            Read-only mapping with rate limiting settings
         """
-        return {
-            "per_minute": self.rate_limit_per_minute,
-            "burst": self.rate_limit_burst,
-            "login_per_minute": self.rate_limit_login_per_minute,
-            "api_key_multiplier": self.api_key_rate_limit_multiplier,
-        }
+        return _build_rate_limit_config(
+            self.rate_limit_per_minute,
+            self.rate_limit_burst,
+            self.rate_limit_login_per_minute,
+            self.api_key_rate_limit_multiplier,
+        )
     
-    def get_security_headers(self) -> Dict[str, str]:
+    def get_token_bucket_params(self) -> Tuple[float, float]:
         """
-        Get security headers configuration.
+        Get token bucket parameters for the per-client rate limiter.
         
         Returns:
-            Dictionary with security headers
+            Tuple of (refill rate in tokens per second, bucket capacity)
         """
-        headers = dict(self.security_headers)
+        return self.rate_limit_per_minute / 60.0, float(self.rate_limit_burst)
+    
+    def get_security_headers(self) -> Mapping[str, str]:
+        """
+        Get security headers configuration.
         
-        # Add HSTS header if HTTPS is forced
-        if self.force_https:
-            hsts_value = f"max-age={self.hsts_max_age}"
-            if self.hsts_include_subdomains:
-                hsts_value += "; includeSubDomains"
-            headers["Strict-Transport-Security"] = hsts_value
+        Returns:
+            Read-only mapping with security headers
+        """
+        return self._security_headers_view
+    
+    def get_security_headers_wire(self) -> Tuple[Tuple[bytes, bytes], ...]:
+        """
+        Get security headers encoded for raw ASGI responses.
         
-        return headers
+        Returns:
+            Tuple of (name, value) byte pairs ready for ``http.response.start``
+        """
+        return self._security_headers_wire
     
-    def get_jwt_config(self) -> Dict[str, Any]:
+    def get_jwt_config(self) -> Mapping[str, Any]:
         """
         Get JWT configuration.
         
         Returns:
-            Dictionary with JWT settings
+            Read-only mapping with JWT settings
         """
-        return {
+        access_token_expire, refresh_token_expire = _jwt_token_lifetimes(
+            self.access_token_expire_minutes, self.refresh_token_expire_days
+        )
+        return MappingProxyType({
             "secret_key": self.secret_key,
             "algorithm": self.algorithm,
-            "access_token_expire": timedelta(minutes=self.access_token_expire_minutes),
-            "refresh_token_expire": timedelta(days=self.refresh_token_expire_days),
-        }
+            "access_token_expire": access_token_expire,
+            "refresh_token_expire": refresh_token_expire,
+        })
     
     def validate_password(self, password: str) -> tuple[bool, List[str]]:
         """
@@ -352,18 +474,31 @@ class SecurityConfig(BaseModel):
         if len(password) < self.password_min_length:
             errors.append(f"Password must be at least {self.password_min_length} characters long")
         
-        if self.password_require_uppercase and not any(c.isupper() for c in password):
+        if password.isascii():
+            # Collect the distinct characters once and test each class in C;
+            # measured faster than a byte-class translate table or four regex
+            # searches
+            chars = set(password)
+            has_upper = not chars.isdisjoint(_ASCII_UPPERCASE)
+            has_lower = not chars.isdisjoint(_ASCII_LOWERCASE)
+            has_digit = not chars.isdisjoint(_ASCII_DIGITS)
+            has_special = not chars.isdisjoint(_PASSWORD_SPECIAL_CHAR_SET)
+        else:
+            has_upper = any(c.isupper() for c in password)
+            has_lower = any(c.islower() for c in password)
+            has_digit = any(c.isdigit() for c in password)
+            has_special = any(c in _PASSWORD_SPECIAL_CHARS for c in password)
+        
+        if self.password_require_uppercase and not has_upper:
             errors.append("Password must contain at least one uppercase letter")
         
-        if self.password_require_lowercase and not any(c.islower() for c in password):
+        if self.password_require_lowercase and not has_lower:
             errors.append("Password must contain at least one lowercase letter")
         
-        if self.password_require_digits and not any(c.isdigit() for c in password):
+        if self.password_require_digits and not has_digit:
             errors.append("Password must contain at least one digit")
         
-        if self.password_require_special:
-            special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-            if not any(c in special_chars for c in password):
-                errors.append(f"Password must contain at least one special character ({special_chars})")
+        if self.password_require_special and not has_special:
+            errors.append(f"Password must contain at least one special character ({_PASSWORD_SPECIAL_CHARS})")
         
         return len(errors) == 0, errors
\ No newline at end of file
@@ -6,13 +6,55 @@ with support for environment variables and default values.
 """
 
 import os
+import sys
 from functools import lru_cache
-from typing import List, Optional
-from pydantic import Field, ConfigDict
-from pydantic_settings import BaseSettings
+from types import MappingProxyType
+from typing import Annotated, Any, List, Mapping, Optional
+from pydantic import BeforeValidator, Field, ConfigDict
+from pydantic_settings import BaseSettings, DotEnvSettingsSource, EnvSettingsSource
 from pydantic import field_validator
 
 
+def _parse_csv(v):
+    """Parse a comma-separated list from an environment variable."""
+    if isinstance(v, str):
+        return [i.strip() for i in v.split(",")]
+    return v
+
+
+_CSV_VALIDATOR = BeforeValidator(_parse_csv)
+
+# List setting that also accepts a comma-separated string
+CsvList = Annotated[List[str], _CSV_VALIDATOR]
+
+
+class _CsvEnvDecodeMixin:
+    """
+    Leave comma-separated values of CsvList settings for their validator.
+    
+    Env sources JSON-decode every list-typed value, which rejects the plain
+    "a,b" form; only values that look like a JSON array are decoded here.
+    """
+    
+    def decode_complex_value(self, field_name, field, value):
+        """Decode a complex env value, passing CSV strings through untouched."""
+        if (
+            isinstance(value, str)
+            and _CSV_VALIDATOR in field.metadata
+            and not value.lstrip().startswith("[")
+        ):
+            return value
+        return super().decode_complex_value(field_name, field, value)
+
+
+class _CsvEnvSettingsSource(_CsvEnvDecodeMixin, EnvSettingsSource):
+    """Environment variable source aware of CsvList settings."""
+
+
+class _CsvDotEnvSettingsSource(_CsvEnvDecodeMixin, DotEnvSettingsSource):
+    """Env file source aware of CsvList settings."""
+
+
 class Settings(BaseSettings):
     """
     Application settings with environment variable support.
@@ -42,7 +84,7 @@ class Settings(BaseSettings):
     openapi_url: str = Field(default="/openapi.json", description="OpenAPI schema URL")
     
     # CORS settings
-    cors_origins: List[str] = Field(
+    cors_origins: CsvList = Field(
         default=[
             "http://localhost:3000",
             "http://localhost:3001", 
@@ -52,8 +94,8 @@ class Settings(BaseSettings):
         description="Allowed CORS origins"
     )
     cors_credentials: bool = Field(default=True, description="Allow credentials in CORS")
-    cors_methods: List[str] = Field(default=["*"], description="Allowed CORS methods")
-    cors_headers: List[str] = Field(default=["*"], description="Allowed CORS headers")
+    cors_methods: CsvList = Field(default=["*"], description="Allowed CORS methods")
+    cors_headers: CsvList = Field(default=["*"], description="Allowed CORS headers")
     
     # Database settings (inherited from database config)
     database_url: str = Field(
@@ -87,7 +129,7 @@ class Settings(BaseSettings):
     
     # File upload settings
     max_file_size: int = Field(default=10 * 1024 * 1024, description="Maximum file size in bytes (10MB)")
-    allowed_file_types: List[str] = Field(
+    allowed_file_types: CsvList = Field(
         default=["image/jpeg", "image/png", "image/gif", "application/pdf"],
         description="Allowed file MIME types"
     )
@@ -98,38 +140,6 @@ class Settings(BaseSettings):
     # Health check settings
     health_check_interval: int = Field(default=30, description="Health check interval in seconds")
     
-    @field_validator("cors_origins", mode="before")
-    @classmethod
-    def assemble_cors_origins(cls, v):
-        """Parse CORS origins from environment variable."""
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @field_validator("cors_methods", mode="before")
-    @classmethod
-    def assemble_cors_methods(cls, v):
-        """Parse CORS methods from environment variable."""
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @field_validator("cors_headers", mode="before")
-    @classmethod
-    def assemble_cors_headers(cls, v):
-        """Parse CORS headers from environment variable."""
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @field_validator("allowed_file_types", mode="before")
-    @classmethod
-    def assemble_allowed_file_types(cls, v):
-        """Parse allowed file types from environment variable."""
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
@@ -155,10 +165,48 @@ class Settings(BaseSettings):
             raise ValueError("Page size must be greater than 0")
         return v
     
+    @classmethod
+    def settings_customise_sources(cls, settings_cls, init_settings, env_settings,
+                                   dotenv_settings, file_secret_settings):
+        """Use env sources that accept comma-separated CsvList values."""
+        # Rebuild from the sources we are given so init-time options such as
+        # _env_file and _env_prefix still apply
+        env_options = {
+            "case_sensitive": env_settings.case_sensitive,
+            "env_prefix": env_settings.env_prefix,
+            "env_nested_delimiter": env_settings.env_nested_delimiter,
+            "env_ignore_empty": env_settings.env_ignore_empty,
+            "env_parse_none_str": env_settings.env_parse_none_str,
+            "env_parse_enums": env_settings.env_parse_enums,
+        }
+        dotenv_options = {
+            "case_sensitive": dotenv_settings.case_sensitive,
+            "env_prefix": dotenv_settings.env_prefix,
+            "env_nested_delimiter": dotenv_settings.env_nested_delimiter,
+            "env_ignore_empty": dotenv_settings.env_ignore_empty,
+            "env_parse_none_str": dotenv_settings.env_parse_none_str,
+            "env_parse_enums": dotenv_settings.env_parse_enums,
+        }
+        return (
+            init_settings,
+            _CsvEnvSettingsSource(settings_cls, **env_options),
+            _CsvDotEnvSettingsSource(
+                settings_cls,
+                env_file=dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+                **dotenv_options,
+            ),
+            file_secret_settings,
+        )
+    
     model_config = ConfigDict(
         env_file=".env",
         env_prefix="APP_",
-        case_sensitive=False
+        case_sensitive=False,
+        # Settings are read-only once loaded; instances passed back into a
+        # model are used as-is rather than copied and revalidated
+        frozen=True,
+        revalidate_instances="never"
     )
 
 
@@ -177,6 +225,32 @@ class TestSettings(Settings):
     max_page_size: int = 20
 
 
+def _load_settings(settings_class: type) -> Settings:
+    """
+    Instantiate a settings class, skipping validation when nothing overrides it.
+    
+    With no APP_* environment variables and no env file every value is a
+    declared default, which is known to be valid, so the instance is built
+    with model_construct() instead of running the env sources and validators.
+    
+    Args:
+        settings_class: Settings class to instantiate
+        
+    Returns:
+        Settings instance
+    """
+    env_file = settings_class.model_config.get("env_file")
+    if (env_file and os.path.exists(env_file)) or any(
+        name[:4].upper() == "APP_" for name in os.environ
+    ):
+        return settings_class()
+    
+    return settings_class.model_construct()
+
+
+# lru_cache rather than a bare module singleton: a cached zero-argument call
+# costs only marginally more, and tests rely on cache_clear() to reload the
+# settings
 @lru_cache()
 def get_settings() -> Settings:
     """
@@ -190,9 +264,9 @@ def get_settings() -> Settings:
     """
     # Check if we're in test mode
     if os.getenv("TESTING") or os.getenv("APP_TESTING"):
-        return TestSettings()
+        return _load_settings(TestSettings)
     
-    return Settings()
+    return _load_settings(Settings)
 
 
 @lru_cache()
@@ -203,41 +277,51 @@ def get_test_settings() -> TestSettings:
     Returns:
         Test settings instance
     """
-    return TestSettings()
+    return _load_settings(TestSettings)
 
 
 # Global settings instance for convenience
 settings = get_settings()
 
 
+# Environment flags, fixed for the life of the process like ``settings``
+IS_TESTING = bool(os.getenv("TESTING") or os.getenv("APP_TESTING") or isinstance(settings, TestSettings))
+IS_DEVELOPMENT = settings.debug
+IS_PRODUCTION = not IS_DEVELOPMENT and not IS_TESTING
+
+
 def is_development() -> bool:
     """Check if the application is running in development mode."""
-    return settings.debug
+    return IS_DEVELOPMENT
 
 
 def is_production() -> bool:
     """Check if the application is running in production mode."""
-    return not settings.debug and not is_testing()
+    return IS_PRODUCTION
 
 
 def is_testing() -> bool:
     """Check if the application is running in test mode."""
-    return os.getenv("TESTING") or os.getenv("APP_TESTING") or isinstance(settings, TestSettings)
+    return IS_TESTING
 
 
-def get_cors_config() -> dict:
+# CORS middleware options; settings are fixed for the life of the process
+CORS_CONFIG = MappingProxyType({
+    "allow_origins": settings.cors_origins,
+    "allow_credentials": settings.cors_credentials,
+    "allow_methods": settings.cors_methods,
+    "allow_headers": settings.cors_headers,
+})
+
+
+def get_cors_config() -> Mapping[str, Any]:
     """
     Get CORS configuration for FastAPI.
     
     Returns:
-        Dictionary with CORS configuration
+        Read-only mapping with CORS configuration
     """
-    return {
-        "allow_origins": settings.cors_origins,
-        "allow_credentials": settings.cors_credentials,
-        "allow_methods": settings.cors_methods,
-        "allow_headers": settings.cors_headers,
-    }
+    return CORS_CONFIG
 
 
 def get_database_config() -> dict:
@@ -304,10 +388,14 @@ def get_logging_config() -> dict:
 
 def print_startup_info():
     """Print application startup information."""
-    print(f"🚀 {settings.app_name} v{settings.app_version}")
-    print(f"📝 {settings.app_description}")
-    print(f"🌐 Server: http://{settings.host}:{settings.port}")
-    print(f"📚 Docs: http://{settings.host}:{settings.port}{settings.docs_url}")
-    print(f"💾 Database: {settings.database_url}")
-    print(f"📊 Log level: {settings.log_level}")
-    print(f"🌍 CORS origins: {', '.join(settings.cors_origins)}")
\ No newline at end of file
+    base_url = f"http://{settings.host}:{settings.port}"
+    lines = (
+        f"🚀 {settings.app_name} v{settings.app_version}",
+        f"📝 {settings.app_description}",
+        f"🌐 Server: {base_url}",
+        f"📚 Docs: {base_url}{settings.docs_url}",
+        f"💾 Database: {settings.database_url}",
+        f"📊 Log level: {settings.log_level}",
+        f"🌍 CORS origins: {', '.join(settings.cors_origins)}",
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
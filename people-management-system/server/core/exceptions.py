@@ -5,10 +5,15 @@ This module defines custom exceptions that provide meaningful error messages
 and appropriate HTTP status codes for various error conditions.
 """
 
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 from fastapi import HTTPException, status
 
 
+# Default challenge sent with 401 responses; shared, so read-only
+_BEARER_CHALLENGE_HEADERS = MappingProxyType({"WWW-Authenticate": "Bearer"})
+
+
 class PeopleManagementException(Exception):
     """Base exception class for the People Management System."""
     
@@ -116,7 +121,7 @@ class HTTPUnauthorizedError(HTTPException):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail,
-            headers=headers or {"WWW-Authenticate": "Bearer"}
+            headers=headers or _BEARER_CHALLENGE_HEADERS
         )
 
 
@@ -248,6 +253,18 @@ class DatabaseTransactionError(HTTPInternalServerError):
         super().__init__(message)
 
 
+# HTTP exception raised for each domain exception, in precedence order
+_HTTP_EXCEPTION_BY_DOMAIN_EXCEPTION = {
+    NotFoundError: HTTPNotFoundError,
+    DuplicateError: HTTPConflictError,
+    ValidationError: HTTPBadRequestError,
+    BusinessLogicError: HTTPUnprocessableEntityError,
+    DatabaseError: HTTPInternalServerError,
+    AuthenticationError: HTTPUnauthorizedError,
+    AuthorizationError: HTTPForbiddenError,
+}
+
+
 def create_http_exception_from_domain_exception(exc: PeopleManagementException) -> HTTPException:
     """
     Convert domain exceptions to HTTP exceptions.
@@ -258,23 +275,18 @@ def create_http_exception_from_domain_exception(exc: PeopleManagementException)
     Returns:
         Appropriate HTTP exception
     """
-    if isinstance(exc, NotFoundError):
-        return HTTPNotFoundError(exc.message)
-    elif isinstance(exc, DuplicateError):
-        return HTTPConflictError(exc.message)
-    elif isinstance(exc, ValidationError):
-        return HTTPBadRequestError(exc.message)
-    elif isinstance(exc, BusinessLogicError):
-        return HTTPUnprocessableEntityError(exc.message)
-    elif isinstance(exc, DatabaseError):
-        return HTTPInternalServerError(exc.message)
-    elif isinstance(exc, AuthenticationError):
-        return HTTPUnauthorizedError(exc.message)
-    elif isinstance(exc, AuthorizationError):
-        return HTTPForbiddenError(exc.message)
-    else:
-        # Default to internal server error for unknown exceptions
-        return HTTPInternalServerError(f"An unexpected error occurred: {exc.message}")
+    http_exception_class = _HTTP_EXCEPTION_BY_DOMAIN_EXCEPTION.get(type(exc))
+    if http_exception_class is None:
+        # Subclasses of the domain exceptions, in precedence order
+        for domain_class, http_class in _HTTP_EXCEPTION_BY_DOMAIN_EXCEPTION.items():
+            if isinstance(exc, domain_class):
+                http_exception_class = http_class
+                break
+        else:
+            # Default to internal server error for unknown exceptions
+            return HTTPInternalServerError(f"An unexpected error occurred: {exc.message}")
+    
+    return http_exception_class(exc.message)
 
 
 def format_validation_error(errors: list) -> dict:
@@ -287,20 +299,17 @@ def format_validation_error(errors: list) -> dict:
     Returns:
         Formatted error response
     """
-    formatted_errors = []
-    
-    for error in errors:
-        formatted_error = {
-            "field": ".".join(str(loc) for loc in error.get("loc", [])),
-            "message": error.get("msg", "Validation error"),
-            "type": error.get("type", "validation_error"),
-            "input": error.get("input")
-        }
-        formatted_errors.append(formatted_error)
-    
     return {
         "detail": "Validation failed",
-        "errors": formatted_errors
+        "errors": [
+            {
+                "field": ".".join(map(str, error.get("loc", ()))),
+                "message": error.get("msg", "Validation error"),
+                "type": error.get("type", "validation_error"),
+                "input": error.get("input")
+            }
+            for error in errors
+        ]
     }
 
 
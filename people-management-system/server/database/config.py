@@ -6,6 +6,7 @@ parameters, connection pooling, and environment-specific configurations.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from pydantic import Field, ConfigDict
@@ -94,8 +95,18 @@ class DatabaseSettings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_database_settings() -> DatabaseSettings:
-    """Get database settings instance."""
+    """
+    Get the database settings instance.
+    
+    The settings are built once and cached, so the environment and .env
+    file are not re-read on every call; use
+    get_database_settings.cache_clear() to reload them.
+    
+    Returns:
+        Database settings instance
+    """
     return DatabaseSettings()
 
 
@@ -171,7 +182,3 @@ def get_engine_kwargs(testing: bool = False) -> dict:
         engine_kwargs["echo"] = False  # Reduce noise in tests
     
     return engine_kwargs
-
-
-# Global settings instance
-database_settings = get_database_settings()
\ No newline at end of file
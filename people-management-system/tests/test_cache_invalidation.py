@@ -0,0 +1,89 @@
+"""
+Tests for the smart cache invalidation system.
+
+This module tests tag-based invalidation, dependency cascading, pattern
+invalidation and empty-tag cleanup in SmartCacheInvalidator.
+"""
+
+import pytest
+
+from server.api.utils.cache import InMemoryCache
+from server.api.utils.cache_invalidation import SmartCacheInvalidator
+
+
+@pytest.fixture
+def invalidator():
+    """Create an invalidator backed by a fresh in-memory cache."""
+    return SmartCacheInvalidator(InMemoryCache(max_size=100))
+
+
+class TestSmartCacheInvalidator:
+    """Tests for the SmartCacheInvalidator class."""
+
+    def test_invalidate_by_tag_removes_cached_keys(self, invalidator):
+        """Test that invalidating a tag deletes its keys from the cache."""
+        invalidator.set_cache_with_tags("person:1", {"id": 1}, ["people_list", "person_1"])
+        invalidator.set_cache_with_tags("person:2", {"id": 2}, "people_list")
+
+        result = invalidator.invalidate_by_tag("people_list", cascade=False)
+
+        assert result["invalidated_keys"] == 2
+        assert invalidator.cache.get("person:1") is None
+        assert invalidator.cache.get("person:2") is None
+
+    def test_invalidate_by_tag_cascades_to_dependents(self, invalidator):
+        """Test that dependent tags are invalidated with their parent."""
+        invalidator.add_dependency("people", "statistics")
+        invalidator.set_cache_with_tags("stats", {"total": 5}, "statistics")
+
+        result = invalidator.invalidate_by_tag("people")
+
+        assert "statistics" in result["invalidated_tags"]
+        assert invalidator.cache.get("stats") is None
+
+    def test_cleanup_empty_tags(self, invalidator):
+        """Test that only tags emptied by invalidation are cleaned up."""
+        invalidator.tag_cache_key("a", "tag_a")
+        invalidator.tag_cache_key("b", "tag_b")
+
+        # Nothing is empty yet
+        assert invalidator.cleanup_empty_tags() == 0
+
+        invalidator.invalidate_by_tag("tag_a", cascade=False)
+        assert invalidator.cleanup_empty_tags() == 1
+        assert invalidator.get_tag_info("tag_a") is None
+        assert invalidator.get_tag_info("tag_b") is not None
+
+        # Cleanup is idempotent
+        assert invalidator.cleanup_empty_tags() == 0
+
+    def test_cleanup_skips_retagged_tags(self, invalidator):
+        """Test that a tag reused after invalidation is not cleaned up."""
+        invalidator.tag_cache_key("a", "tag_a")
+        invalidator.invalidate_by_tag("tag_a", cascade=False)
+        invalidator.tag_cache_key("a2", "tag_a")
+
+        assert invalidator.cleanup_empty_tags() == 0
+        assert invalidator.get_tag_info("tag_a")["key_count"] == 1
+
+    def test_invalidate_by_pattern_marks_tags_empty(self, invalidator):
+        """Test that pattern invalidation leaves emptied tags for cleanup."""
+        invalidator.tag_cache_key("person:1", "person_1")
+        invalidator.add_pattern("person_*", "person:1")
+
+        invalidator.invalidate_by_pattern("person_*")
+
+        assert invalidator.cleanup_empty_tags() == 1
+
+    def test_get_stats_tracks_dependency_count(self, invalidator):
+        """Test that the dependency total follows additions and cleanup."""
+        invalidator.add_dependency("people", "statistics")
+        invalidator.add_dependency("people", "statistics")
+        invalidator.add_dependency("employment", "statistics")
+        assert invalidator.get_stats()["total_dependencies"] == 2
+
+        invalidator.tag_cache_key("stats", "statistics")
+        invalidator.invalidate_by_tag("statistics", cascade=False)
+        invalidator.cleanup_empty_tags()
+
+        assert invalidator.get_stats()["total_dependencies"] == 0
@@ -0,0 +1,122 @@
+"""
+Tests for application and database configuration.
+
+This module tests how Settings reads list values and env files, and how
+DatabaseConfig detects backends and configures SQLite connections.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from pydantic import ValidationError
+
+from server.config.database import DatabaseBackend, DatabaseConfig
+from server.config.environments import (
+    Environment, TestingConfig, get_config_for_environment, reload_config
+)
+from server.core.config import Settings
+
+
+class TestSettingsSources:
+    """Tests for the env sources used by Settings."""
+
+    def test_cors_origins_comma_separated(self, monkeypatch):
+        """Test that a comma-separated CORS origins value is split."""
+        monkeypatch.setenv("APP_CORS_ORIGINS", "http://a.test, http://b.test")
+
+        settings = Settings(_env_file=None)
+        assert settings.cors_origins == ["http://a.test", "http://b.test"]
+
+    def test_cors_origins_json_array(self, monkeypatch):
+        """Test that a JSON array CORS origins value is still decoded."""
+        monkeypatch.setenv("APP_CORS_ORIGINS", '["http://a.test", "http://b.test"]')
+
+        settings = Settings(_env_file=None)
+        assert settings.cors_origins == ["http://a.test", "http://b.test"]
+
+    def test_env_file_argument(self, tmp_path, monkeypatch):
+        """Test that an env file passed at init time is read."""
+        monkeypatch.delenv("APP_PORT", raising=False)
+        env_file = tmp_path / "custom.env"
+        env_file.write_text("APP_PORT=9123\nAPP_CORS_METHODS=GET,POST\n")
+
+        settings = Settings(_env_file=str(env_file))
+        assert settings.port == 9123
+        assert settings.cors_methods == ["GET", "POST"]
+
+
+class TestDatabaseConfig:
+    """Tests for DatabaseConfig backend detection and engine options."""
+
+    @pytest.mark.parametrize("url, backend", [
+        ("sqlite:///people.db", DatabaseBackend.SQLITE),
+        ("postgresql+psycopg2://user@localhost/people", DatabaseBackend.POSTGRESQL),
+        ("postgres://user@localhost/people", DatabaseBackend.POSTGRESQL),
+        ("mysql+pymysql://user@localhost/people", DatabaseBackend.MYSQL),
+        ("mariadb://user@localhost/people", DatabaseBackend.MYSQL),
+    ])
+    def test_backend_detected_from_url(self, url, backend):
+        """Test that the backend is detected from the URL scheme."""
+        config = DatabaseConfig(url=url)
+        assert config.backend == backend
+        # A detected backend is not reported as set by the caller
+        assert config.model_fields_set == {"url"}
+
+    def test_explicit_backend_kept(self):
+        """Test that an explicitly given backend is not overridden."""
+        config = DatabaseConfig(url="postgres://user@localhost/people",
+                                backend=DatabaseBackend.MYSQL)
+        assert config.backend == DatabaseBackend.MYSQL
+
+    def test_sqlite_pragmas_applied_on_connect(self, tmp_path):
+        """Test that the configured PRAGMAs are issued on new connections."""
+        config = DatabaseConfig(url=f"sqlite:///{tmp_path / 'people.db'}")
+        engine = create_engine(config.url, **config.get_engine_options())
+        config.register_engine_events(engine)
+        try:
+            with engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+                assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        finally:
+            engine.dispose()
+
+    def test_sqlite_pool_defaults(self):
+        """Test that file-backed SQLite keeps the smaller pool defaults."""
+        config = DatabaseConfig(url="sqlite:///people.db")
+        assert (config.pool_size, config.max_overflow) == (5, 10)
+        options = config.get_engine_options()
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 10
+
+        # Explicit sizes win, even when equal to the server defaults
+        config = DatabaseConfig(url="sqlite:///people.db", pool_size=10)
+        assert config.get_engine_options()["pool_size"] == 10
+
+    def test_server_backend_pool_defaults(self):
+        """Test that server backends get the larger pool defaults."""
+        options = DatabaseConfig(url="postgresql://user@localhost/people").get_engine_options()
+        assert options["pool_size"] == 10
+        assert options["max_overflow"] == 20
+
+
+class TestEnvironmentConfig:
+    """Tests for the cached per-environment configurations."""
+
+    def test_one_shared_instance_per_environment(self, monkeypatch):
+        """Test that every form of the call returns the same instance."""
+        monkeypatch.setenv("TESTING", "true")
+        reload_config()
+        try:
+            config = get_config_for_environment()
+            assert isinstance(config, TestingConfig)
+            assert get_config_for_environment(Environment.TESTING) is config
+            assert get_config_for_environment("testing") is config
+        finally:
+            reload_config()
+
+    def test_shared_instance_is_read_only(self):
+        """Test that the shared configuration cannot be modified."""
+        config = get_config_for_environment(Environment.TESTING)
+        with pytest.raises(ValidationError):
+            config.debug = False
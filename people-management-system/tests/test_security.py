@@ -11,7 +11,7 @@ from typing import Dict, Any, List
 
 from server.api.utils.security import (
     InputSanitizer, SecurityError, RequestValidator,
-    sanitize_search_term, sanitize_person_data,
+    sanitize_search_term, sanitize_person_data, sanitize_person_data_batch,
     create_security_headers, log_security_event
 )
 
@@ -218,6 +218,15 @@ class TestInputSanitizer:
         with pytest.raises(SecurityError, match="Email address too long"):
             sanitizer.sanitize_email(long_email)
     
+    def test_sanitize_email_no_catastrophic_backtracking(self):
+        """Test that long non-matching emails are rejected in linear time."""
+        sanitizer = InputSanitizer()
+        
+        # These inputs backtracked exponentially with the previous pattern
+        for email in ["a" * 200 + "!", "a@" + "a" * 200 + "!", "a-" * 100 + "@x"]:
+            with pytest.raises(SecurityError, match="Invalid email format"):
+                sanitizer.sanitize_email(email)
+    
     def test_sanitize_email_dangerous_content(self):
         """Test email sanitization with dangerous content."""
         sanitizer = InputSanitizer()
@@ -307,6 +316,9 @@ class TestInputSanitizer:
         assert "?" not in result
         # Unsafe characters should be replaced with underscores
         assert "_" in result
+        
+        # A trailing newline is not a safe character either
+        assert sanitizer.sanitize_filename("report.pdf\n") == "report.pdf_"
     
     def test_sanitize_filename_too_long(self):
         """Test filename length limits."""
@@ -340,6 +352,9 @@ class TestInputSanitizer:
             "123e4567-e89b-12d3-a456",  # Too short
             "123e4567-e89b-12d3-a456-426614174000-extra",  # Too long
             "123e4567_e89b_12d3_a456_426614174000",  # Wrong separators
+            "123e4567-e89b-12d3-a456-42661417400g",  # Non-hex digit
+            "-23e4567-e89b-12d3-a456-426614174000",  # Extra dash
+            "123e4567-e89b-12d3-a456-426614174000\n",  # Trailing newline
             ""
         ]
         
@@ -615,6 +630,20 @@ class TestUtilityFunctions:
         assert "javascript:" not in result["notes"]
         assert "../" not in result["address"]
     
+    def test_sanitize_person_data_batch_matches_single(self):
+        """Test that batch sanitization equals per-row sanitization."""
+        rows = [
+            {"first_name": "John", "city": "New  York", "email": "JOHN@example.com", "tags": ["a"]},
+            {"first_name": "<b>Jane</b>", "city": "New  York", "phone": "bad-phone"},
+            {"last_name": "Doe", "date_of_birth": "1990-01-01", "notes": ""},
+            {},
+        ]
+        
+        result = sanitize_person_data_batch(rows)
+        
+        assert result == [sanitize_person_data(row) for row in rows]
+        assert [list(r) for r in result] == [list(sanitize_person_data(row)) for row in rows]
+    
     def test_create_security_headers(self):
         """Test security headers creation."""
         headers = create_security_headers()
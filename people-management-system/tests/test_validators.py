@@ -0,0 +1,35 @@
+"""
+Tests for API validation utilities.
+
+This module tests the cached current-date helpers shared by the validators
+and response formatters.
+"""
+
+import time
+from datetime import date, datetime
+
+from server.api.utils import validators
+from server.api.utils.validators import get_today, get_today_iso
+
+
+class TestCurrentDate:
+    """Tests for the day-rollover cached date helpers."""
+
+    def test_today_matches_local_date(self):
+        """Test that the cached date and ISO string describe today."""
+        today = date.today()
+        assert get_today() == today
+        assert get_today_iso() == today.isoformat()
+
+    def test_recomputed_at_local_midnight(self, monkeypatch):
+        """Test that the cached date rolls over at the next local midnight."""
+        midnight = time.mktime(datetime(2024, 3, 5).timetuple())
+        monkeypatch.setattr(validators, "_today_cache", (0.0, None, ""))
+
+        monkeypatch.setattr(validators.time, "time", lambda: midnight - 1)
+        assert get_today() == date(2024, 3, 4)
+        assert get_today_iso() == "2024-03-04"
+
+        monkeypatch.setattr(validators.time, "time", lambda: midnight)
+        assert get_today() == date(2024, 3, 5)
+        assert get_today_iso() == "2024-03-05"